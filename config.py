@@ -8,4 +8,10 @@
 
 # HYPERLINK_PATTERN = r"<a\s+(?:[^>]*?\s)?\bhref\s*=\s*(?P<border>[\"'])(?P<url>[^\"']*)(?P=border)[^>]*>(?P<content>.*?)<\/a>" # re.DOTALL для что-то-href
 
-HYPERLINK_PATTERN = r"<a\s+(?:[^>]*?\s)?\bhref\s*=\s*(?P<border>[\"'])(?P<url>[^\"']*)(?P=border)[^>]*>" # re.DOTALL без контента для что-то-href
+# HYPERLINK_PATTERN = r"<a\s+(?:[^>]*?\s)?\bhref\s*=\s*(?P<border>[\"'])(?P<url>[^\"']*)(?P=border)[^>]*>" # re.DOTALL без контента для что-то-href, квадратичный перебор на длинных пробелах
+
+# HYPERLINK_PATTERN = r"<a(?=\s)[^>]*?\shref\s*=\s*(?P<border>[\"'])(?P<url>[^\"']*)(?P=border)[^>]*>" # re.DOTALL без контента для что-то-href, квадратичный перебор на незакрытых <a
+
+# HYPERLINK_PATTERN = r"<a(?=\s)(?>[^<>]*?\shref\s*=\s*(?P<border>[\"'])(?P<url>[^\"']*)(?P=border))[^<>]*>" # re.DOTALL без контента для что-то-href, теряет теги с < в значениях атрибутов
+
+HYPERLINK_PATTERN = r"<a(?=\s)(?>(?:[^<>\"']|\"[^\"]*\"|'[^']*')*?\shref\s*=\s*(?P<border>[\"'])(?P<url>[^\"']*)(?P=border))(?:[^<>\"']|\"[^\"]*\"|'[^']*')*+>" # re.DOTALL без контента для что-то-href, значения атрибутов в кавычках читаются целиком
@@ -1,8 +1,12 @@
+import mmap
+import os
 import re
-from typing import Optional, Any
-from urllib.parse import urljoin, urlparse, ParseResult
-from functools import cached_property
+from concurrent.futures import ProcessPoolExecutor
+from functools import cache, lru_cache, partial
+from typing import Optional, Any, AnyStr, Iterable, Iterator
+from urllib.parse import urljoin, urlparse, urlunparse, ParseResult, uses_netloc, uses_relative
 import requests
+from requests.adapters import HTTPAdapter
 from requests.exceptions import RequestException
 from pathlib import Path
 
@@ -11,17 +15,209 @@ from errors import EmptyValueForMethodError
 from config import HYPERLINK_PATTERN
 
 
+@cache
+def _get_compiled(pattern: AnyStr, flags: int = re.IGNORECASE | re.DOTALL | re.ASCII) -> re.Pattern[AnyStr]:
+    """Компилирует шаблон гиперссылки один раз на всё время работы программы.
+
+    Через этот кэш LinkExtractor._get_link_bytes_pattern при каждом чтении файла получает байтовый вариант
+    _LINK_PATTERN своего класса: он компилируется один раз на каждый шаблон, а не при каждом вызове
+    extract_from_file. В отличие от внутреннего кэша re, размер этого кэша не ограничен и он не очищается.
+
+    Args:
+        pattern: Шаблон регулярного выражения (строка или байты);
+        flags: Флаги регулярного выражения. По умолчанию re.IGNORECASE | re.DOTALL | re.ASCII
+            (пробельные символы и регистр только для ASCII, как у байтового шаблона и пробельных символов HTML).
+
+    Returns:
+        Скомпилированное регулярное выражение.
+    """
+
+    return re.compile(pattern, flags)
+
+
+_LINK_RE = _get_compiled(HYPERLINK_PATTERN)
+
+# Схема URL по RFC 3986 (та же проверка, что выполняет urlparse, но без разбора всего URL).
+_SCHEME_RE = re.compile(r"[a-zA-Z][a-zA-Z0-9+\-.]*:")
+
+# Размер блока при потоковом чтении ответа сервера и длина хвоста предыдущего блока, который проверяется повторно
+# вместе со следующим блоком (тег <a> длиннее хвоста, разрезанный границей блоков, найден не будет).
+_STREAM_CHUNK_SIZE = 64 * 1024
+_STREAM_TAIL_SIZE = 8 * 1024
+
+# Маркер ещё не вычисленного значения в кэше свойств Link (None - допустимый результат).
+_UNSET = object()
+
+# Ссылки, которые urlparse может прочитать не по их виду: с собственным доменом (//), с управляющим
+# символом в начале или с удаляемыми urlparse символами табуляции и переноса строки. Для них быстрые
+# проверки без urlparse не применяются.
+_JOIN_FALLBACK_RE = re.compile(r"\A(?://|[\x00-\x20])|[\t\n\r]")
+
+# Относительные ссылки, которые urljoin меняет при сборке абсолютной ссылки: точечные сегменты пути (/. и /..),
+# параметры (;), пустые запрос и фрагмент, квадратные скобки в домене и удаляемые urlparse символы.
+_JOIN_REBUILD_RE = re.compile(r"[;\t\n\r\[\]]|/\.|\?#|[?#]\Z")
+
+
+def _findall_urls(pattern: re.Pattern[AnyStr], content: AnyStr) -> list[AnyStr]:
+    """Находит ссылки (группа url) шаблоном гиперссылки через findall, без создания объектов Match.
+
+    Args:
+        pattern: Скомпилированный шаблон гиперссылки с именованной группой url;
+        content: HTML-код (строка, байты или отображённый в память файл).
+
+    Returns:
+        Найденные ссылки.
+    """
+
+    matches = pattern.findall(content)
+
+    # При нескольких группах findall возвращает кортежи групп, при одной группе - сами ссылки.
+    if pattern.groups > 1:
+        url_index = pattern.groupindex["url"] - 1
+
+        return [groups[url_index] for groups in matches]
+
+    return matches
+
+
+class _BaseURL:
+    """Класс разобранной базовой ссылки, общий для всех ссылок с одинаковой базовой ссылкой.
+
+    Attributes:
+        url: Базовая ссылка;
+        domain: Домен в нижнем регистре, который urljoin даёт относительным ссылкам без собственного домена,
+            или None (_UNSET, если базовую ссылку не удалось разобрать);
+        _scheme_prefix: Схема с двоеточием для ссылок вида //домен/путь (None, если urljoin их так не собирает);
+        _origin: Схема и домен для ссылок вида /путь (None, если urljoin их так не собирает);
+        _fragmentless: Базовая ссылка без фрагмента для ссылок вида #фрагмент (None, если urljoin их так не собирает).
+    """
+
+    __slots__ = ("url", "domain", "_scheme_prefix", "_origin", "_fragmentless")
+
+    def __init__(self, url: str):
+        self.url = url
+        self._scheme_prefix = None
+        self._origin = None
+        self._fragmentless = None
+
+        try:
+            parsed = urlparse(url)
+        except ValueError:
+            self.domain = _UNSET
+
+            return
+
+        if parsed.scheme not in uses_relative or parsed.scheme not in uses_netloc:
+            self.domain = None
+
+            return
+
+        self.domain = parsed.netloc.lower() or None
+
+        self._scheme_prefix = f"{parsed.scheme}:" if parsed.scheme else ""
+        self._origin = f"{self._scheme_prefix}//{parsed.netloc}" if parsed.netloc else None
+        self._fragmentless = urlunparse(parsed._replace(fragment=""))
+
+    def join(self, url: str) -> Optional[str]:
+        """Соединяет базовую ссылку с относительной без urljoin для частых видов ссылок.
+
+        Результат совпадает с urljoin: ссылки, которые urljoin перестраивает, сюда не попадают.
+
+        Args:
+            url: Относительная ссылка.
+
+        Returns:
+            Абсолютная ссылка или None, если ссылку нужно соединить через urljoin.
+        """
+
+        if _JOIN_REBUILD_RE.search(url) is not None:
+            return None
+
+        if url.startswith("#"):
+            return self._fragmentless + url if self._fragmentless is not None else None
+
+        if url.startswith("//"):
+            # После // должен начинаться домен (непустой и без не-ASCII символов, которые urlparse проверяет).
+            if self._scheme_prefix is None or url[2:3] in ("", "/", "?", "#") or not url.isascii():
+                return None
+
+            return self._scheme_prefix + url
+
+        if url.startswith("/") and self._origin is not None:
+            return self._origin + url
+
+        return None
+
+
+@lru_cache(maxsize=256)
+def _get_base_url(url: str) -> _BaseURL:
+    """Возвращает разобранную базовую ссылку (одну на все ссылки с такой базовой ссылкой).
+
+    Args:
+        url: Базовая ссылка.
+
+    Returns:
+        Экземпляр класса _BaseURL.
+    """
+
+    return _BaseURL(url)
+
+
 class Link:
     """Класс ссылки.
 
     Attributes:
-        _url: Ссылка.
-        _base_url: Базовая ссылка (опционально).
+        _url: Ссылка;
+        _base: Разобранная базовая ссылка (опционально);
+        _is_absolute, _absolute, _scheme, _domain, _path, _parsed_cache: Кэш вычисляемых свойств
+            (_UNSET, пока не вычислены).
     """
 
+    __slots__ = ("_url", "_base", "_is_absolute", "_absolute", "_scheme", "_domain", "_path", "_parsed_cache")
+
     def __init__(self, url: str, base_url: Optional[str] = None):
         self._url = url.strip()
-        self._base_url = base_url.strip() if base_url else None
+        self._base = _get_base_url(base_url.strip()) if base_url else None
+
+        self._reset_cache()
+
+    @classmethod
+    def from_matches(cls, urls: Iterable[str], base_url: Optional[str] = None) -> list["Link"]:
+        """Создаёт экземпляры класса Link для набора найденных ссылок с общей базовой ссылкой.
+
+        В отличие от конструктора, не очищает ссылки и базовую ссылку от пробелов по краям и получает
+        разобранную базовую ссылку один раз на весь набор.
+
+        Args:
+            urls: Ссылки без пробелов по краям;
+            base_url: Базовая ссылка без пробелов по краям (опционально).
+
+        Returns:
+            Список экземпляров класса Link.
+        """
+
+        base = _get_base_url(base_url) if base_url else None
+        new = object.__new__
+        links = []
+
+        for url in urls:
+            link = new(cls)
+            link._url = url
+            link._base = base
+            link._reset_cache()
+
+            links.append(link)
+
+        return links
+
+    def _reset_cache(self):
+        """Помечает все кэшированные свойства как ещё не вычисленные."""
+
+        self._is_absolute = self._absolute = self._scheme = self._domain = self._path = self._parsed_cache = _UNSET
+
+    def __reduce__(self):
+        # Кэш не сериализуется: маркер _UNSET не переживает pickle (например, при передаче между процессами).
+        return self.__class__, (self._url, self.base_url)
 
     @property
     def url(self) -> str:
@@ -41,7 +237,7 @@ class Link:
             Базовая ссылка или None.
         """
 
-        return self._base_url
+        return self._base.url if self._base else None
 
     @property
     def is_absolute(self) -> bool:
@@ -51,9 +247,16 @@ class Link:
             Является ли URL абсолютным.
         """
 
-        return bool(urlparse(self.url).scheme)
+        if self._is_absolute is _UNSET:
+            if _JOIN_FALLBACK_RE.search(self.url) is None:
+                self._is_absolute = _SCHEME_RE.match(self.url) is not None
+            else:
+                # urlparse удаляет управляющие символы и переносы строк до поиска схемы.
+                self._is_absolute = bool(urlparse(self.url).scheme)
 
-    @cached_property
+        return self._is_absolute
+
+    @property
     def absolute(self) -> Optional[str]:
         """Абсолютный URL или None.
 
@@ -61,15 +264,17 @@ class Link:
             Абсолютный URL или None.
         """
 
-        if self.is_absolute:
-            return self.url
-
-        if not self.base_url:
-            return None
+        if self._absolute is _UNSET:
+            if self.is_absolute:
+                self._absolute = self.url
+            elif not self.base_url:
+                self._absolute = None
+            else:
+                self._absolute = self._base.join(self._url) or urljoin(self.base_url, self.url)
 
-        return urljoin(self.base_url, self.url)
+        return self._absolute
 
-    @cached_property
+    @property
     def scheme(self) -> Optional[str]:
         """Схема абсолютного URL или None.
 
@@ -77,12 +282,12 @@ class Link:
             Схема абсолютного URL или None.
         """
 
-        if self.absolute:
-            return self._parsed.scheme
+        if self._scheme is _UNSET:
+            self._scheme = self._parsed.scheme if self.absolute else None
 
-        return None
+        return self._scheme
 
-    @cached_property
+    @property
     def domain(self) -> Optional[str]:
         """Домен в нижнем регистре или None.
 
@@ -90,14 +295,21 @@ class Link:
             Домен в нижнем регистре или None.
         """
 
-        if self.absolute:
-            domain = self._parsed.netloc
+        if self._domain is _UNSET:
+            base = self._base
 
-            return domain.lower() if domain else None
+            if (self._url and not self.is_absolute and base is not None and base.domain is not _UNSET
+                    and _JOIN_FALLBACK_RE.search(self._url) is None):
+                # Относительная ссылка без собственного домена получает домен базовой ссылки - без urljoin и urlparse.
+                self._domain = base.domain
+            else:
+                domain = self._parsed.netloc if self.absolute else None
 
-        return None
+                self._domain = domain.lower() if domain else None
+
+        return self._domain
 
-    @cached_property
+    @property
     def path(self) -> Optional[str]:
         """Путь абсолютной ссылки или None.
 
@@ -105,10 +317,10 @@ class Link:
             Путь абсолютной ссылки или None.
         """
 
-        if self.absolute:
-            return urlparse(self.absolute).path or None
+        if self._path is _UNSET:
+            self._path = (self._parsed.path or None) if self.absolute else None
 
-        return None
+        return self._path
 
     @property
     def info(self) -> dict[str, Any]:
@@ -128,7 +340,7 @@ class Link:
             "path": self.path,
         }
 
-    @cached_property
+    @property
     def _parsed(self) -> ParseResult:
         """Кэшированный результат urlparse.
 
@@ -136,9 +348,12 @@ class Link:
             Кэшированный результат urlparse.
         """
 
-        url_to_parse = self.absolute if self.absolute is not None else self.url
+        if self._parsed_cache is _UNSET:
+            url_to_parse = self.absolute if self.absolute is not None else self.url
+
+            self._parsed_cache = urlparse(url_to_parse)
 
-        return urlparse(url_to_parse)
+        return self._parsed_cache
 
 
 class LinkExtractor:
@@ -148,8 +363,62 @@ class LinkExtractor:
         Список экземпляров класса Link.
     """
 
+    _LINK_PATTERN = _LINK_RE
+
     def __init__(self, base_url: Optional[str] = None):
         self._base_url = base_url.rstrip("/") if base_url else None
+        self._session: Optional[requests.Session] = None
+
+    def __enter__(self) -> "LinkExtractor":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """Закрывает HTTP-сессию и её пул соединений (если сессия была создана)."""
+
+        if self._session is not None:
+            self._session.close()
+
+            self._session = None
+
+    def _get_session(self) -> requests.Session:
+        """HTTP-сессия с пулом соединений, создаётся при первом запросе.
+
+        Повторные запросы к тому же хосту переиспользуют открытое соединение (Keep-Alive)
+        без новых TCP и TLS рукопожатий.
+
+        Returns:
+            HTTP-сессия.
+        """
+
+        if self._session is None:
+            adapter = HTTPAdapter(pool_connections=10, pool_maxsize=10)
+
+            self._session = requests.Session()
+            self._session.mount("http://", adapter)
+            self._session.mount("https://", adapter)
+
+        return self._session
+
+    @classmethod
+    def _get_link_bytes_pattern(cls) -> re.Pattern[bytes]:
+        """Байтовый вариант _LINK_PATTERN для поиска прямо по отображённому в память файлу (mmap).
+
+        Строится из шаблона и флагов _LINK_PATTERN, поэтому переопределение _LINK_PATTERN в подклассе
+        действует и на extract_from_file. В байтовом шаблоне пробельные символы и re.IGNORECASE работают
+        только с ASCII: если _LINK_PATTERN скомпилирован без re.ASCII, ссылки с не-ASCII пробелами внутри тега
+        (например, неразрывным пробелом) находятся в HTML-коде, но не в файле.
+
+        Returns:
+            Скомпилированный байтовый шаблон гиперссылки.
+        """
+
+        pattern = cls._LINK_PATTERN
+
+        # re.UNICODE недопустим для байтовых шаблонов.
+        return _get_compiled(pattern.pattern.encode(), pattern.flags & ~re.UNICODE)
 
     def extract_from_file(self, html_file_path: str, unique: bool = False) -> list[Link]:
         """Извлекает ссылки и возвращает экземпляры класса Link из файла .HTML.
@@ -177,14 +446,47 @@ class LinkExtractor:
             raise ValueError(f"Указанный путь не является файлом .HTML: {path}.")
 
         try:
-            with open(html_file_path, "r", encoding="utf-8") as html_file:
-                html_code = html_file.read()
+            with open(html_file_path, "rb") as html_file:
+                # Пустой файл нельзя отобразить в память.
+                if not os.fstat(html_file.fileno()).st_size:
+                    return []
+
+                # Файл не читается в память целиком: регулярное выражение идёт по страницам mmap,
+                # а в UTF-8 декодируются только найденные ссылки.
+                with mmap.mmap(html_file.fileno(), 0, access=mmap.ACCESS_READ) as html_code:
+                    urls = [url.decode("utf-8").strip() for url in _findall_urls(self._get_link_bytes_pattern(), html_code)]
         except PermissionError:
             raise PermissionError(f"Отсутствуют права на чтение файла {path}.")
         except OSError as ex:
             raise OSError(f"Ошибка при чтении файла {path}.\nТекст ошибки: {ex}")
 
-        return self.extract_from_html_code(html_code, unique)
+        return self._build_links(urls, unique)
+
+    def extract_from_files(
+            self,
+            html_file_paths: list[str],
+            unique: bool = False,
+            workers: Optional[int] = None
+            ) -> list[list[Link]]:
+        """Извлекает ссылки из нескольких файлов .HTML параллельно в отдельных процессах.
+
+        Args:
+            html_file_paths: Список путей к файлам .HTML;
+            unique: Если True - дубликаты ссылок в каждом файле удаляются. По умолчанию False;
+            workers: Количество процессов. По умолчанию - количество процессоров.
+
+        Returns:
+            Списки объектов Link для каждого файла в порядке html_file_paths.
+
+        Raises:
+            FileNotFoundError: Файл .HTML не найден;
+            ValueError: Указанный путь не является файлом .HTML;
+            PermissionError: Отсутствуют права на чтение файла;
+            OSError: Ошибка при чтении файла.
+        """
+
+        with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as executor:
+            return list(executor.map(partial(self.extract_from_file, unique=unique), html_file_paths, chunksize=8))
 
     def extract_from_url(self, unique: bool = False) -> list[Link]:
         """Извлекает ссылки и возвращает экземпляры класса Link из url.
@@ -204,11 +506,16 @@ class LinkExtractor:
             raise EmptyValueForMethodError("base_url")
 
         try:
-            response = requests.get(self._base_url, timeout=25)
+            with self._get_session().get(self._base_url, stream=True, timeout=25) as response:
+                response.raise_for_status()
 
-            response.raise_for_status()
+                # Без кодировки в заголовках iter_content отдаёт байты, а не строки.
+                if response.encoding is None:
+                    response.encoding = "utf-8"
 
-            return self.extract_from_html_code(response.text, unique)
+                chunks = response.iter_content(chunk_size=_STREAM_CHUNK_SIZE, decode_unicode=True)
+
+                return self._build_links(self._iter_urls_from_chunks(chunks), unique)
         except RequestException as ex:
             raise RequestException(f"Ошибка при получении доступа к удалённому ресурсу {self._base_url}.\nТекст ошибки: {ex}")
 
@@ -226,16 +533,52 @@ class LinkExtractor:
         if not html_content:
             return []
 
-        hyperlink_regex = re.compile(HYPERLINK_PATTERN, re.IGNORECASE | re.DOTALL)
+        urls = (url.strip() for url in _findall_urls(self._LINK_PATTERN, html_content))
+
+        return self._build_links(urls, unique)
 
-        matches = hyperlink_regex.finditer(html_content)
+    def _iter_urls_from_chunks(self, chunks: Iterable[str]) -> Iterator[str]:
+        """Ищет ссылки в HTML-коде, поступающем по частям, не собирая его целиком.
 
-        urls = [match.group("url").strip() for match in matches]
+        Конец каждого блока после последней найденной ссылки (не длиннее _STREAM_TAIL_SIZE) проверяется ещё раз
+        вместе со следующим блоком, чтобы найти теги, разрезанные границей блоков.
+
+        Args:
+            chunks: Части HTML-кода.
+
+        Returns:
+            Найденные ссылки.
+        """
+
+        tail = ""
+
+        for chunk in chunks:
+            buffer = tail + chunk
+            consumed = 0
+
+            for match in self._LINK_PATTERN.finditer(buffer):
+                yield match.group("url").strip()
+
+                consumed = match.end()
+
+            tail = buffer[max(consumed, len(buffer) - _STREAM_TAIL_SIZE):]
+
+    def _build_links(self, urls: Iterable[str], unique: bool) -> list[Link]:
+        """Создаёт экземпляры класса Link из найденных ссылок.
+
+        Args:
+            urls: Найденные ссылки;
+            unique: Если True - дубликаты ссылок удаляются.
+
+        Returns:
+            Список объектов Link (без дубликатов, если unique is True).
+        """
 
+        # dict.fromkeys убирает дубликаты за один проход и сохраняет порядок ссылок в документе.
         if unique:
-            urls = set(urls)
+            urls = dict.fromkeys(urls)
 
-        return [Link(url=url, base_url=self._base_url) for url in urls]
+        return Link.from_matches(urls, self._base_url.strip() if self._base_url else None)
 
     @staticmethod
     def validate_links(links: list[Link]) -> list[dict[str, Any]]:
@@ -285,7 +628,8 @@ if __name__ == "__main__":
         print(f"\tПуть: {info["path"]}")
 
     print()
-    print("Колчество гиперссылок по URL:", len(LinkExtractor("https://convertio.co/ru").extract_from_url()))
+    with LinkExtractor("https://convertio.co/ru") as url_extractor:
+        print("Колчество гиперссылок по URL:", len(url_extractor.extract_from_url()))
     print()
 
     print("Ссылки из файла:")
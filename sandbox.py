@@ -1,3 +1,5 @@
+import io
+import sys
 from typing import Optional
 
 from main import Link, LinkExtractor
@@ -11,10 +13,38 @@ TEXT_INPUT_HTML_CODE = "HTML-код"
 TEXT_INPUT_BASE_URL = "Базовый URL"
 TEXT_INPUT_UNIQUE = "Уникальные"
 
+TEXT_INPUT_SUFFIX = ": "
+TEXT_INPUT_SUFFIX_OPTIONAL = " (Опционально): "
+TEXT_INPUT_BOOL_SUFFIX = "? [y/n]"
+
+INPUT_TRUE_VALUES = frozenset({"y", "да", "+"})
+
 TEXT_PRINT_SEPARATOR = "#" * 50
 
+TEXT_HELP = "\n".join([
+    "",
+    "=" * 60,
+    "Источник:",
+    "1 - Файл",
+    "2 - URL",
+    "3 - Поток",
+    "0 / help - показать это меню",
+    "exit - выйти из программы",
+    "=" * 60
+])
+
 
 class Sandbox:
+    def __init__(self):
+        self._commands = {
+            "1": self.extract_from_file,
+            "2": self.extract_from_url,
+            "3": self.extract_from_stream,
+            "0": self.print_help,
+            "help": self.print_help,
+            "exit": self.exit
+        }
+
     def extract_from_file(self):
         """Извлекает гиперссылки из файла .HTML."""
 
@@ -35,10 +65,9 @@ class Sandbox:
         url: str = self.input_str(TEXT_INPUT_URL)
         unique: Optional[bool] = self.input_bool(TEXT_INPUT_UNIQUE)
 
-        exctractor: LinkExtractor = LinkExtractor(url)
-
         try:
-            hyperlinks: list[Link] = exctractor.extract_from_url(unique=unique)
+            with LinkExtractor(url) as exctractor:
+                hyperlinks: list[Link] = exctractor.extract_from_url(unique=unique)
 
             self.print_hyperlinks_info(hyperlinks)
         except Exception as ex:
@@ -72,15 +101,11 @@ class Sandbox:
 
             return
 
-        print(TEXT_PRINT_SEPARATOR)
-        print(f"Найдено гиперссылок: {hyperlinks_len}")
-        print(TEXT_PRINT_SEPARATOR)
+        lines: list[str] = [TEXT_PRINT_SEPARATOR, f"Найдено гиперссылок: {hyperlinks_len}", TEXT_PRINT_SEPARATOR]
+        lines.extend(f"Ссылка {index}:\n{hyperlink.info}" for index, hyperlink in enumerate(hyperlinks, 1))
+        lines.append(TEXT_PRINT_SEPARATOR)
 
-        for index, hyperlink in enumerate(hyperlinks):
-            print(f"Ссылка {index + 1}:")
-            print(hyperlink.info)
-
-        print(TEXT_PRINT_SEPARATOR)
+        sys.stdout.write("\n".join(lines) + "\n")
 
     @staticmethod
     def print_error(ex: Exception):
@@ -97,14 +122,7 @@ class Sandbox:
     def print_help():
         """Выводит помощь по работе с программой."""
 
-        print("\n" + "=" * 60)
-        print("Источник:")
-        print("1 - Файл")
-        print("2 - URL")
-        print("3 - Поток")
-        print("0 / help - показать это меню")
-        print("exit - выйти из программы")
-        print("=" * 60)
+        print(TEXT_HELP)
 
     def input_all_params(
             self,
@@ -140,7 +158,7 @@ class Sandbox:
             Введённые пользователем с клавиатуры значения, склеенные в строку.
         """
 
-        html_codes: list[str] = []
+        html_codes: io.StringIO = io.StringIO()
 
         print("Начинается ввод в цикле")
 
@@ -153,9 +171,9 @@ class Sandbox:
             if param == stop_command:
                 break
             else:
-                html_codes.append(param)
+                html_codes.write(param)
 
-        return "".join(html_codes)
+        return html_codes.getvalue()
 
     def input_bool(self, prompt: str) -> bool:
         """Принимает введённое пользователем с клавиатуры булевое значение.
@@ -164,9 +182,9 @@ class Sandbox:
             prompt: Промпт для ввода значения запрашиваемого параметра.
         """
 
-        value: Optional[str] = self.input_str(f"{prompt}? [y/n]", can_be_empty=True)
+        value: Optional[str] = self.input_str(prompt + TEXT_INPUT_BOOL_SUFFIX, can_be_empty=True)
 
-        if value in ["y", "Да", "+"]:
+        if value is not None and value.lower() in INPUT_TRUE_VALUES:
             return True
         else:
             return False
@@ -183,8 +201,10 @@ class Sandbox:
             Значение для запрашиваемого параметра (None, если can_be_empty is True).
         """
 
+        prompt += TEXT_INPUT_SUFFIX_OPTIONAL if can_be_empty else TEXT_INPUT_SUFFIX
+
         while True:
-            value: str = input(f"{prompt}{(' (Опционально)' if can_be_empty else '')}: ").strip()
+            value: str = input(prompt).strip()
 
             if value:
                 return value
@@ -197,21 +217,17 @@ class Sandbox:
     def run(self):
         """Запускает работу песочницы."""
 
-        commands = {
-            "1": self.extract_from_file,
-            "2": self.extract_from_url,
-            "3": self.extract_from_stream,
-            "0": self.print_help,
-            "help": self.print_help,
-            "exit": self.exit
-        }
-
         try:
             while True:
-                cmd: str = input("\nВведите источник (0 / help - список источников): ").strip().lower()
+                cmd: str = input("\nВведите источник (0 / help - список источников): ").strip()
+
+                if not cmd:
+                    continue
+
+                command = self._commands.get(cmd.lower())
 
-                if cmd in commands:
-                    commands[cmd]()
+                if command is not None:
+                    command()
                 else:
                     print("Неизвестная команда. Введите 'help'.")
         except (KeyboardInterrupt, EOFError):
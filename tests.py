@@ -1,19 +1,58 @@
+import re
+import stat
+import tempfile
 import unittest
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
 from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import patch
+from urllib.parse import urljoin, urlparse
 
 import requests
 from bs4 import BeautifulSoup
 from requests import RequestException
+from requests.adapters import HTTPAdapter
 
-from main import LinkExtractor
+from main import Link, LinkExtractor
+
+HTML_SUFFIXES = frozenset({".html", ".htm"})
 
 class TestHyperlinkRegex(unittest.TestCase):
     """Класс тестов регулярного выражения для поиска гиперссылок."""
 
-    def setUp(self):
-        """Создаёт новый экземпляр класса LinkExtractor при каждом новом тесте."""
+    @classmethod
+    def setUpClass(cls):
+        """Создаёт общие для всех тестов экземпляр класса LinkExtractor, HTTP-сессию с пулом соединений
+        и пул из четырёх потоков для параллельных загрузок и проверок.
+
+        LinkExtractor без базовой ссылки не хранит состояния между вызовами, поэтому один экземпляр безопасно
+        использовать во всех тестах.
+        """
+
+        cls.extractor = LinkExtractor()
+        cls.executor = ThreadPoolExecutor(max_workers=4)
+
+        cls.session = requests.Session()
+        cls.session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8))
+
+    @classmethod
+    def tearDownClass(cls):
+        """Закрывает общие экземпляр класса LinkExtractor, HTTP-сессию и пул потоков."""
+
+        cls.extractor.close()
+        cls.session.close()
+        cls.executor.shutdown()
 
-        self.extractor = LinkExtractor()
+    def assert_links_count(self, html_code: str, count: int):
+        """Проверяет количество ссылок, найденных в HTML-коде.
+
+        Args:
+            html_code: HTML-код;
+            count: Ожидаемое количество ссылок.
+        """
+
+        self.assertEqual(len(self.extractor.extract_from_html_code(html_code)), count)
 
     def test_with_enters(self):
         """Проверяет гиперссылки с пробельными символами."""
@@ -38,7 +77,7 @@ class TestHyperlinkRegex(unittest.TestCase):
             <a href="https://example.ru">\nЧто-то\n
         """
 
-        self.assertEqual(len(self.extractor.extract_from_html_code(html_code)), 9)
+        self.assert_links_count(html_code, 9)
 
     def test_valid_quoted(self):
         """Проверяет гиперссылки с корректными кавычками."""
@@ -50,7 +89,8 @@ class TestHyperlinkRegex(unittest.TestCase):
         ]
 
         for hyperlink in hyperlinks:
-            self.assertEqual(len(self.extractor.extract_from_html_code(hyperlink)), 1)
+            with self.subTest(hyperlink=hyperlink):
+                self.assert_links_count(hyperlink, 1)
 
     def test_invalid_quoted(self):
         """Проверяет гиперссылки с некорректными кавычками."""
@@ -62,7 +102,8 @@ class TestHyperlinkRegex(unittest.TestCase):
         ]
 
         for hyperlink in hyperlinks:
-            self.assertEqual(len(self.extractor.extract_from_html_code(hyperlink)), 0)
+            with self.subTest(hyperlink=hyperlink):
+                self.assert_links_count(hyperlink, 0)
 
     def test_spaces_inside_quotes(self):
         """Проверяет гиперссылки с пробелами внутри ссылки."""
@@ -75,7 +116,8 @@ class TestHyperlinkRegex(unittest.TestCase):
         ]
 
         for hyperlink in hyperlinks:
-            self.assertEqual(len(self.extractor.extract_from_html_code(hyperlink)), 1)
+            with self.subTest(hyperlink=hyperlink):
+                self.assert_links_count(hyperlink, 1)
 
     def test_spaces_near_href_equal_operator(self):
         """Проверяет гиперссылки с пробелами между = после атрибута href."""
@@ -87,7 +129,8 @@ class TestHyperlinkRegex(unittest.TestCase):
         ]
 
         for hyperlink in hyperlinks:
-            self.assertEqual(len(self.extractor.extract_from_html_code(hyperlink)), 1)
+            with self.subTest(hyperlink=hyperlink):
+                self.assert_links_count(hyperlink, 1)
 
     def test_empty_url(self):
         """Проверяет гиперссылки на пустые ссылки."""
@@ -98,10 +141,11 @@ class TestHyperlinkRegex(unittest.TestCase):
         ]
 
         for hyperlink in hyperlinks:
-            self.assertEqual(len(self.extractor.extract_from_html_code(hyperlink)), 1)
+            with self.subTest(hyperlink=hyperlink):
+                self.assert_links_count(hyperlink, 1)
 
     def test_with_other_attributes(self):
-        """Проверяет гиперссылки с другими атрибутами до href и написанием в верхнем регистре href."""
+        """Проверяет гиперссылки с другими атрибутами до href (в том числе с < и > в значениях) и написанием в верхнем регистре href."""
 
         hyperlinks = [
             '<a target="target" href="https://example.ru">',
@@ -109,11 +153,16 @@ class TestHyperlinkRegex(unittest.TestCase):
             '<a href="https://example.ru" target="target">',
             '<a href="https://example.ru" class="hyperlink">',
             '<a target="target" href="https://example.ru" class="hyperlink">',
-            '<a HREF="https://example.ru">'
+            '<a HREF="https://example.ru">',
+            '<a href="https://example.ru" title="a<b">',
+            '<a title="<" href="https://example.ru">',
+            '<a onclick="return a<b" href="https://example.ru">',
+            "<a title='a>b' href=\"https://example.ru\" onclick='return a<b'>"
         ]
 
         for hyperlink in hyperlinks:
-            self.assertEqual(len(self.extractor.extract_from_html_code(hyperlink)), 1)
+            with self.subTest(hyperlink=hyperlink):
+                self.assert_links_count(hyperlink, 1)
 
     def test_with_unicode_characters(self):
         """Проверяет гиперссылки с символами из Unicode."""
@@ -124,7 +173,8 @@ class TestHyperlinkRegex(unittest.TestCase):
         ]
 
         for hyperlink in hyperlinks:
-            self.assertEqual(len(self.extractor.extract_from_html_code(hyperlink)), 1)
+            with self.subTest(hyperlink=hyperlink):
+                self.assert_links_count(hyperlink, 1)
 
     def test_href_with_html_entities(self):
         """Проверяет гиперссылки с сущностями HTML."""
@@ -135,7 +185,8 @@ class TestHyperlinkRegex(unittest.TestCase):
         ]
 
         for hyperlink in hyperlinks:
-            self.assertEqual(len(self.extractor.extract_from_html_code(hyperlink)), 1)
+            with self.subTest(hyperlink=hyperlink):
+                self.assert_links_count(hyperlink, 1)
 
     def test_with_different_schemes(self):
         """Проверяет гиперссылки с различными схемами."""
@@ -147,7 +198,8 @@ class TestHyperlinkRegex(unittest.TestCase):
         ]
 
         for hyperlink in hyperlinks:
-            self.assertEqual(len(self.extractor.extract_from_html_code(hyperlink)), 1)
+            with self.subTest(hyperlink=hyperlink):
+                self.assert_links_count(hyperlink, 1)
 
     def test_invalid_href_name(self):
         """Проверяет гиперссылки с неправильным атрибутом href."""
@@ -161,7 +213,8 @@ class TestHyperlinkRegex(unittest.TestCase):
         ]
 
         for hyperlink in hyperlinks:
-            self.assertEqual(len(self.extractor.extract_from_html_code(hyperlink)), 0)
+            with self.subTest(hyperlink=hyperlink):
+                self.assert_links_count(hyperlink, 0)
 
     def test_other_attributes_with_href_word_are_ignored(self):
         """Проверяет гиперссылки со сломанным тегом <a>."""
@@ -175,7 +228,92 @@ class TestHyperlinkRegex(unittest.TestCase):
         ]
 
         for hyperlink in hyperlinks:
-            self.assertEqual(len(self.extractor.extract_from_html_code(hyperlink)), 0)
+            with self.subTest(hyperlink=hyperlink):
+                self.assert_links_count(hyperlink, 0)
+
+    def test_long_tags_without_href(self):
+        """Проверяет длинные и незакрытые теги <a> (без квадратичного перебора регулярного выражения)."""
+
+        hyperlinks = [
+            "<a" + " " * 20000 + ">",
+            "<a" + " data-x=\"y\"" * 5000 + ">",
+            "<a" + "\t\n" * 10000,
+            "<a " * 20000,
+            "<a" + ' href="x"' * 20000
+        ]
+
+        for hyperlink in hyperlinks:
+            with self.subTest(hyperlink=hyperlink):
+                self.assert_links_count(hyperlink, 0)
+
+    def test_link_pattern_with_content_group(self):
+        """Проверяет подкласс LinkExtractor с шаблоном гиперссылки из config.py, содержащим группу content."""
+
+        class ContentLinkExtractor(LinkExtractor):
+            _LINK_PATTERN = re.compile(
+                r"<a\s+(?:[^>]*?\s)?\bhref\s*=\s*(?P<border>[\"'])(?P<url>[^\"']*)(?P=border)[^>]*>(?P<content>.*?)<\/a>",
+                re.IGNORECASE | re.DOTALL
+            )
+
+        html_code = '<a href="/x">X</a><a class="y" href=\'/y\'>Y</a>'
+        extractor = ContentLinkExtractor()
+
+        self.assertEqual([link.url for link in extractor.extract_from_html_code(html_code)], ["/x", "/y"])
+        self.assertEqual(list(extractor._iter_urls_from_chunks([html_code])), ["/x", "/y"])
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "file.html"
+            path.write_text(html_code, encoding="utf-8")
+
+            self.assertEqual([link.url for link in extractor.extract_from_file(str(path))], ["/x", "/y"])
+
+    def test_extract_from_file_like_extract_from_html_code(self):
+        """Проверяет, что из файла .HTML и из того же HTML-кода извлекаются одинаковые ссылки."""
+
+        hyperlinks = [
+            '<a href="/x">X</a>',
+            '<A HREF="/x">X</A>',
+            '<a\xa0href="/x">X</a>',
+            '<a\u3000href="/x">X</a>',
+            '<a href\xa0=\xa0"/x">X</a>',
+            '<a title="пример" href="/путь">X</a>',
+            '<a title="a<b" href="/x">X</a>'
+        ]
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "file.html"
+
+            for hyperlink in hyperlinks:
+                with self.subTest(hyperlink=hyperlink):
+                    path.write_text(hyperlink, encoding="utf-8")
+
+                    self.assertEqual(
+                        [link.url for link in self.extractor.extract_from_file(str(path))],
+                        [link.url for link in self.extractor.extract_from_html_code(hyperlink)]
+                    )
+
+    @staticmethod
+    def count_links_with_bs4(html_code: str | bytes) -> int:
+        """Считает гиперссылки в HTML-коде библиотекой bs4.
+
+        HTML-код без тегов <a> не разбирается: проверка вхождения подстроки намного дешевле разбора bs4.
+
+        Args:
+            html_code: HTML-код (строка или байты).
+
+        Returns:
+            Количество тегов <a> с атрибутом href.
+        """
+
+        if isinstance(html_code, str):
+            has_anchors = "<a" in html_code.lower()
+        else:
+            has_anchors = html_code.find(b"<a") != -1 or html_code.find(b"<A") != -1
+
+        if not has_anchors:
+            return 0
+
+        return len(BeautifulSoup(html_code, "lxml").find_all("a", href=True))
 
     def test_regex_working_with_file_like_bs4(self):
         """Проверяет список эквивалентность списков ссылок, полученных нашей программой и библиотекой bs4.
@@ -195,28 +333,101 @@ class TestHyperlinkRegex(unittest.TestCase):
         for path in paths:
             path_to_file = Path(path)
 
-            if not path_to_file.exists():
+            try:
+                path_stat = path_to_file.stat()
+            except FileNotFoundError:
                 raise FileNotFoundError(f"Файл .HTML не найден: {path_to_file}.")
 
-            if not path_to_file.is_file() or path_to_file.suffix not in (".html", ".htm"):
+            if not stat.S_ISREG(path_stat.st_mode) or path_to_file.suffix not in HTML_SUFFIXES:
                 raise ValueError(f"Указанный путь не является файлом .HTML: {path_to_file}.")
 
             try:
-                with open(path_to_file, "r", encoding="utf-8") as html_file:
+                # BeautifulSoup всё равно читает любой объект с методом read целиком, поэтому файл читается
+                # в байты сразу, а кодировку bs4 определяет сам.
+                with open(path_to_file, "rb") as html_file:
                     html_code = html_file.read()
-
-                    soup = BeautifulSoup(html_code, "html.parser")
-
-                    links_bs4_len = len([a.get("href") for a in soup.find_all("a") if a.get("href")])
             except PermissionError:
                 raise PermissionError(f"Отсутствуют права на чтение файла {path_to_file}.")
             except OSError as ex:
                 raise OSError(f"Ошибка при чтении файла {path_to_file}.\nТекст ошибки: {ex}")
 
+            links_bs4_len = self.count_links_with_bs4(html_code)
             links_this_program_len = len(self.extractor.extract_from_file(path))
 
             self.assertEqual(links_this_program_len, links_bs4_len)
 
+    def test_extract_from_files_like_extract_from_file(self):
+        """Проверяет, что параллельное извлечение из нескольких файлов совпадает с извлечением из каждого файла."""
+
+        paths = [
+            "file.html",
+            "file.html"
+        ]
+
+        links_from_files = self.extractor.extract_from_files(paths, workers=2)
+
+        self.assertEqual(len(links_from_files), len(paths))
+
+        for path, links in zip(paths, links_from_files):
+            self.assertEqual([link.info for link in links], [link.info for link in self.extractor.extract_from_file(path)])
+
+    def fetch_html_code(self, url: str) -> str:
+        """Получает HTML-код удалённого ресурса через общую HTTP-сессию.
+
+        Args:
+            url: URL удалённого ресурса.
+
+        Returns:
+            HTML-код.
+
+        Raises:
+            RequestException: Ошибка при получении доступа к удалённому ресурсу.
+        """
+
+        try:
+            response = self.session.get(url, timeout=25)
+
+            response.raise_for_status()
+
+            return response.text
+        except RequestException as ex:
+            raise RequestException(f"Ошибка при получении доступа к удалённому ресурсу {url}.\nТекст ошибки: {ex}")
+
+    def test_extract_from_url_by_chunks(self):
+        """Проверяет извлечение ссылок из ответа сервера, пришедшего частями (без обращения к сети)."""
+
+        chunks = ['<a href="/first">1</a><a hr', 'ef="/second">2</a><a href="https://example.ru/third"', '>3</a>']
+
+        response = SimpleNamespace(
+            encoding=None,
+            raise_for_status=lambda: None,
+            iter_content=lambda chunk_size, decode_unicode: iter(chunks)
+        )
+        session = SimpleNamespace(get=lambda url, **kwargs: nullcontext(response))
+
+        with patch.object(LinkExtractor, "_get_session", return_value=session):
+            links = LinkExtractor("https://example.ru").extract_from_url()
+
+        self.assertEqual(
+            [link.absolute for link in links],
+            ["https://example.ru/first", "https://example.ru/second", "https://example.ru/third"]
+        )
+        self.assertEqual(response.encoding, "utf-8")
+
+    @staticmethod
+    def count_links_from_url(url: str) -> int:
+        """Считает гиперссылки на удалённом ресурсе нашей программой.
+
+        Args:
+            url: URL удалённого ресурса.
+
+        Returns:
+            Количество найденных гиперссылок.
+        """
+
+        with LinkExtractor(url) as extractor:
+            return len(extractor.extract_from_url())
+
     def test_regex_working_with_url_like_bs4(self):
         """Проверяет список эквивалентность списков ссылок, полученных нашей программой и библиотекой bs4.
         Поиск на удалённом ресурсе по URL.
@@ -230,21 +441,16 @@ class TestHyperlinkRegex(unittest.TestCase):
             "https://youtube.com"
         ]
 
-        for url in urls:
-            try:
-                response = requests.get(url, timeout=25)
-
-                response.raise_for_status()
-
-                soup = BeautifulSoup(response.text, "html.parser")
+        html_codes = list(self.executor.map(self.fetch_html_code, urls))
 
-                links_bs4_len = len([a.get("href") for a in soup.find_all("a") if a.get("href")])
-            except RequestException as ex:
-                raise RequestException(f"Ошибка при получении доступа к удалённому ресурсу {url}.\nТекст ошибки: {ex}")
-
-            links_this_program_len = len(LinkExtractor(url).extract_from_url())
+        # Разбор bs4 и собственные загрузка и поиск ссылок не зависят друг от друга и выполняются параллельно.
+        counts = [
+            (self.executor.submit(self.count_links_from_url, url), self.executor.submit(self.count_links_with_bs4, html_code))
+            for url, html_code in zip(urls, html_codes)
+        ]
 
-            self.assertEqual(links_this_program_len, links_bs4_len)
+        for links_this_program_len, links_bs4_len in counts:
+            self.assertEqual(links_this_program_len.result(), links_bs4_len.result())
 
     def test_regex_working_with_html_code_like_bs4(self):
         """Проверяет список эквивалентность списков ссылок, полученных нашей программой и библиотекой bs4.
@@ -272,12 +478,75 @@ class TestHyperlinkRegex(unittest.TestCase):
 
         links_this_program_len = len(self.extractor.extract_from_html_code(html_code))
 
-        soup = BeautifulSoup(html_code, "html.parser")
-
-        links_bs4_len = len([a.get("href") for a in soup.find_all("a") if a.get("href")])
+        links_bs4_len = self.count_links_with_bs4(html_code)
 
         self.assertEqual(links_this_program_len, links_bs4_len)
 
 
+class TestLink(unittest.TestCase):
+    """Класс тестов класса ссылки."""
+
+    def test_without_instance_dict(self):
+        """Проверяет, что у ссылки нет __dict__ и кэш свойств хранится в слотах."""
+
+        link = Link("/relative/path", "https://example.ru")
+
+        self.assertFalse(hasattr(link, "__dict__"))
+        self.assertEqual(link.info, link.info)
+        self.assertEqual(link.absolute, "https://example.ru/relative/path")
+
+    def test_from_matches_like_constructor(self):
+        """Проверяет, что ссылки из from_matches совпадают со ссылками, созданными конструктором."""
+
+        urls = ["https://example.ru", "/path", "contact.html", "#section"]
+
+        for base_url in ["https://example.ru", "", None]:
+            with self.subTest(base_url=base_url):
+                self.assertEqual(
+                    [link.info for link in Link.from_matches(urls, base_url)],
+                    [Link(url, base_url).info for url in urls]
+                )
+
+    def test_is_absolute_like_urlparse(self):
+        """Проверяет, что признак абсолютной ссылки совпадает с наличием схемы по urlparse."""
+
+        urls = [
+            "https://example.ru", "mailto:user@example.ru", "/path", "contact.html", "//host", "c:path", "1a:path",
+            "ht\ntp://host", "ht\ttp://host", "ht\rtp://host", "\x01https://host", " https://host", "\x00//host"
+        ]
+
+        for url in urls:
+            with self.subTest(url=url):
+                self.assertEqual(Link(url).is_absolute, bool(urlparse(url.strip()).scheme))
+
+    def test_domain_like_urljoin(self):
+        """Проверяет, что домен относительной ссылки совпадает с доменом, полученным через urljoin и urlparse."""
+
+        base_urls = ["https://Example.ru/a/b", "http://u:p@Host:8080/", "mailto:user@example.ru", "example.ru", ""]
+        urls = ["contact.html", "/path?q#f", "#section", "//youtube.com/video", "/\n/evil.ru", "ht\ntp://host", "\x01//host"]
+
+        for base_url in base_urls:
+            for url in urls:
+                with self.subTest(base_url=base_url, url=url):
+                    absolute = url if urlparse(url).scheme else (urljoin(base_url, url) if base_url else None)
+                    netloc = urlparse(absolute).netloc.lower() if absolute else None
+
+                    self.assertEqual(Link(url, base_url).domain, netloc or None)
+
+    def test_absolute_like_urljoin(self):
+        """Проверяет, что абсолютная ссылка для относительной совпадает с результатом urljoin."""
+
+        base_urls = ["https://Example.ru", "HTTPS://EX.RU/a/b?q=1#f", "http://host/a;p", "mailto:user@example.ru", "//host/x"]
+        urls = [
+            "#section", "#", "/path", "/", "/a/../b", "/a;p", "/a?", "/a?#f", "/a?q#f",
+            "//youtube.com/video", "///path", "//[::1]/x", "//сайт.рф", "contact.html", "../about/team"
+        ]
+
+        for base_url in base_urls:
+            for url in urls:
+                with self.subTest(base_url=base_url, url=url):
+                    self.assertEqual(Link(url, base_url).absolute, urljoin(base_url, url))
+
+
 if __name__ == '__main__':
     unittest.main()